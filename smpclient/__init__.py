@@ -370,7 +370,7 @@ class SMPClient:
         else:
             assert_never(response)  # pragma: no cover
 
-        file_data = response.data
+        file_data: Final = bytearray(response.data)
 
         # send chunks until the SMP server reports that the offset is at the end of the image
         while response.off + len(response.data) != file_length:
@@ -381,12 +381,12 @@ class SMPClient:
             if error(response):
                 raise SMPUploadError(response)
             elif success(response):
-                file_data += response.data
+                file_data.extend(response.data)
             else:
                 assert_never(response)  # pragma: no cover
 
         logger.info("Download complete")
-        return file_data
+        return bytes(file_data)
 
     @property
     def address(self) -> str:
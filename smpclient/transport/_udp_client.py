@@ -80,7 +80,7 @@ class _UDPProtocol(asyncio.DatagramProtocol):
 
     @override
     def datagram_received(self, data: bytes, addr: Tuple[str | Any, int]) -> None:
-        logger.debug(f"{len(data)} B datagram received from {addr}")
+        logger.debug("%d B datagram received from %s", len(data), addr)
         self._receive_queue.put_nowait(data)
 
     @override
@@ -188,7 +188,11 @@ class SMPBLETransport(SMPTransport):
         if sender.uuid != str(SMP_CHARACTERISTIC_UUID):  # pragma: no cover
             raise SMPBLETransportException(f"Unexpected notify from {sender}; {data=}")
         async with self._notify_condition:
-            logger.debug(f"Received {len(data)} bytes from {SMP_CHARACTERISTIC_UUID=}")
+            logger.debug(
+                "Received %d bytes from SMP_CHARACTERISTIC_UUID=%r",
+                len(data),
+                SMP_CHARACTERISTIC_UUID,
+            )
             self._buffer.extend(data)
             self._notify_condition.notify()
 
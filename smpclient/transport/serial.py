@@ -8,7 +8,6 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
-import time
 from enum import IntEnum, unique
 from functools import cached_property
 from typing import Final
@@ -140,11 +139,18 @@ class SMPSerialTransport(SMPTransport):
     async def connect(self, address: str, timeout_s: float) -> None:
         self._conn.port = address
         logger.debug(f"Connecting to {self._conn.port=}")
-        start_time: Final = time.time()
-        while time.time() - start_time <= timeout_s:
+        try:
+            await asyncio.wait_for(self._open(), timeout_s)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Failed to connect to {address=}")
+        logger.debug(f"Connected to {self._conn.port=}")
+
+    async def _open(self) -> None:
+        """Open the serial port, retrying until it succeeds or the caller times out."""
+
+        while True:
             try:
                 self._conn.open()
-                logger.debug(f"Connected to {self._conn.port=}")
                 return
             except SerialException as e:
                 logger.debug(
@@ -153,8 +159,6 @@ class SMPSerialTransport(SMPTransport):
                 )
                 await asyncio.sleep(SMPSerialTransport._CONNECTION_RETRY_INTERVAL_S)
 
-        raise TimeoutError(f"Failed to connect to {address=}")
-
     @override
     async def disconnect(self) -> None:
         logger.debug(f"Disconnecting from {self._conn.port=}")
@@ -171,7 +175,11 @@ class SMPSerialTransport(SMPTransport):
         try:
             for packet in smppacket.encode(data, line_length=self._line_length):
                 self._conn.write(packet)
-                logger.debug(f"Writing encoded packet of size {len(packet)}B; {self._line_length=}")
+                logger.debug(
+                    "Writing encoded packet of size %dB; self._line_length=%d",
+                    len(packet),
+                    self._line_length,
+                )
 
             # fake async until I get around to replacing pyserial
             while self._conn.out_waiting > 0:
@@ -250,7 +258,7 @@ class SMPSerialTransport(SMPTransport):
                                 )
                             except UnicodeDecodeError:  # log as bytes if not
                                 logger.warning(f"{self._conn.port}: {self._buffer.ser[:i].hex()}")
-                            self._buffer.ser = self._buffer.ser[i + 1 :]
+                            del self._buffer.ser[: i + 1]
                         except ValueError:
                             break
                     await asyncio.sleep(SMPSerialTransport._POLLING_INTERVAL_S)
@@ -288,7 +296,7 @@ class SMPSerialTransport(SMPTransport):
 
                 # out is everything up to and including the delimiter
                 out = self._buffer.smp[:i_smp_end]
-                logger.debug(f"Received {len(out)} byte chunk")
+                logger.debug("Received %d byte chunk", len(out))
 
                 # there may be some leftover to save for the next read, but
                 # it's not necessarily SMP data
@@ -79,7 +79,7 @@ class SMPUDPTransport(SMPTransport):
             logger.debug(f"Waiting for the rest of the {message_length} B response")
             while len(message) < message_length:
                 packet = await self._client.receive()
-                logger.debug(f"Received {len(packet)} B")
+                logger.debug("Received %d B", len(packet))
                 message.extend(packet)
             if len(message) > message_length:
                 error: Final = (
@@ -80,7 +80,7 @@ def test_SMP_gatt_consts() -> None:
     return_value=BLEDevice("address", "name", None, -60),
 )
 @patch("smpclient.transport.ble.BleakClient", new=MockBleakClient)
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_connect(
     mock_find_device_by_name: MagicMock,
     mock_find_device_by_address: MagicMock,
@@ -139,7 +139,7 @@ async def test_connect(
     t._client.start_notify.assert_called_once_with(SMP_CHARACTERISTIC_UUID, t._notify_callback)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_disconnect() -> None:
     t = SMPBLETransport()
     t._client = MagicMock(spec=BleakClient)
@@ -147,7 +147,7 @@ async def test_disconnect() -> None:
     t._client.disconnect.assert_awaited_once_with()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_send() -> None:
     t = SMPBLETransport()
     t._client = MagicMock(spec=BleakClient)
@@ -159,7 +159,7 @@ async def test_send() -> None:
     )
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_receive() -> None:
     t = SMPBLETransport()
     t._client = MagicMock(spec=BleakClient)
@@ -190,7 +190,7 @@ async def test_receive() -> None:
     assert b == REP
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_send_and_receive() -> None:
     t = SMPBLETransport()
     t.send = AsyncMock()  # type: ignore
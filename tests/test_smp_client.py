@@ -5,7 +5,7 @@ from __future__ import annotations
 import sys
 from hashlib import sha256
 from pathlib import Path
-from typing import List
+from typing import Final, List
 from unittest.mock import AsyncMock, PropertyMock, call, patch
 
 import pytest
@@ -78,6 +78,27 @@ class SMPMockTransport:
         return await self.receive()
 
 
+PAYLOAD_4097: Final = bytes([i % 255 for i in range(4097)])
+"""A 4097 byte payload that is not a multiple of any chunk size used in these tests."""
+
+
+@pytest.fixture(scope="module")
+def image() -> bytes:
+    """The signed hello_world image, read once per module."""
+    with open(
+        str(Path("tests", "fixtures", "zephyr-v3.5.0-2795-g28ff83515d", "hello_world.signed.bin")),
+        "rb",
+    ) as f:
+        return f.read()
+
+
+@pytest.fixture(scope="module")
+def file_data(request: pytest.FixtureRequest) -> bytes:
+    """The contents of the `file_system` fixture named by the indirect parameter."""
+    with open(str(Path("tests", "fixtures", "file_system", request.param)), "rb") as f:
+        return f.read()
+
+
 def test_constructor() -> None:
     m = SMPMockTransport()
     s = SMPClient(m, "address")
@@ -85,7 +106,7 @@ def test_constructor() -> None:
     assert s._address == "address"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_connect() -> None:
     m = SMPMockTransport()
     s = SMPClient(m, "address")
@@ -96,7 +117,7 @@ async def test_connect() -> None:
     s._initialize.assert_awaited_once_with()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_request() -> None:
     m = SMPMockTransport()
     s = SMPClient(m, "address")
@@ -175,7 +196,7 @@ async def test_request() -> None:
         raise AssertionError(f"Unexpected response type: {type(rep)}")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_upload() -> None:
     m = SMPMockTransport()
     s = SMPClient(m, "address")
@@ -188,7 +209,7 @@ async def test_upload() -> None:
 
     chunk_size = 415  # max chunk given MTU
 
-    image = bytes([i % 255 for i in range(4097)])
+    image = PAYLOAD_4097
     req = ImageUploadWrite(
         off=0,
         data=image[:chunk_size],
@@ -284,20 +305,14 @@ async def test_upload() -> None:
 
 @patch("tests.test_smp_client.SMPMockTransport.mtu", new_callable=PropertyMock)
 @patch("tests.test_smp_client.SMPMockTransport.max_unencoded_size", new_callable=PropertyMock)
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 @pytest.mark.parametrize("mtu", [124, 127, 251, 498, 512, 1024, 2048, 4096, 8192])
 async def test_upload_hello_world_bin(
-    mock_mtu: PropertyMock, mock_max_unencoded_size: PropertyMock, mtu: int
+    mock_mtu: PropertyMock, mock_max_unencoded_size: PropertyMock, mtu: int, image: bytes
 ) -> None:
     mock_mtu.return_value = mtu
     mock_max_unencoded_size.return_value = mtu
 
-    with open(
-        str(Path("tests", "fixtures", "zephyr-v3.5.0-2795-g28ff83515d", "hello_world.signed.bin")),
-        "rb",
-    ) as f:
-        image = f.read()
-
     m = SMPMockTransport()
     s = SMPClient(m, "address")
 
@@ -317,18 +332,12 @@ async def test_upload_hello_world_bin(
     assert accumulated_image == image
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 @pytest.mark.parametrize("max_smp_encoded_frame_size", [128, 256, 512, 1024, 2048, 4096, 8192])
 @pytest.mark.parametrize("line_buffers", [1, 2, 3, 4, 8])
 async def test_upload_hello_world_bin_encoded(
-    max_smp_encoded_frame_size: int, line_buffers: int
+    max_smp_encoded_frame_size: int, line_buffers: int, image: bytes
 ) -> None:
-    with open(
-        str(Path("tests", "fixtures", "zephyr-v3.5.0-2795-g28ff83515d", "hello_world.signed.bin")),
-        'rb',
-    ) as f:
-        image = f.read()
-
     line_length = max_smp_encoded_frame_size // line_buffers
     if line_length < 82:  # TODO: get better coverage
         pytest.skip("The line buffer size is too small")
@@ -386,7 +395,7 @@ async def test_upload_hello_world_bin_encoded(
     assert reconstructed_image == image
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_upload_file() -> None:
     m = SMPMockTransport()
     s = SMPClient(m, "address")
@@ -399,7 +408,7 @@ async def test_upload_file() -> None:
 
     chunk_size = 455  # max chunk given MTU
 
-    data = bytes([i % 255 for i in range(4097)])
+    data = PAYLOAD_4097
     req = FileUpload(off=0, data=data[:chunk_size], len=len(data), name="test.txt")
 
     u = s.upload_file(data, file_path="test.txt")
@@ -488,50 +497,22 @@ async def test_upload_file() -> None:
 
 @patch("tests.test_smp_client.SMPMockTransport.mtu", new_callable=PropertyMock)
 @patch("tests.test_smp_client.SMPMockTransport.max_unencoded_size", new_callable=PropertyMock)
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 @pytest.mark.parametrize("mtu", [124, 127, 251, 498, 512, 1024, 2048, 4096, 8192])
-async def test_file_upload_test_txt(
-    mock_mtu: PropertyMock, mock_max_unencoded_size: PropertyMock, mtu: int
-) -> None:
-    mock_mtu.return_value = mtu
-    mock_max_unencoded_size.return_value = mtu
-    with open(
-        str(Path("tests", "fixtures", "file_system", "test.txt")),
-        "rb",
-    ) as f:
-        data = f.read()
-
-    m = SMPMockTransport()
-    s = SMPClient(m, "address")
-
-    accumulated_data = bytearray([])
-
-    async def mock_request(request: FileUpload, timeout_s: float = 120.000) -> FileUploadResponse:
-        accumulated_data.extend(request.data)
-        return FileUpload._Response.get_default()(off=request.off + len(request.data))  # type: ignore # noqa
-
-    s.request = mock_request  # type: ignore
-
-    async for _ in s.upload_file(data, file_path="test.txt"):
-        pass
-
-    assert accumulated_data == data
-
-
-@patch("tests.test_smp_client.SMPMockTransport.mtu", new_callable=PropertyMock)
-@patch("tests.test_smp_client.SMPMockTransport.max_unencoded_size", new_callable=PropertyMock)
-@pytest.mark.asyncio
-@pytest.mark.parametrize("mtu", [124, 127, 251, 498, 512, 1024, 2048, 4096, 8192])
-async def test_file_upload_test_255_bytes_file(
-    mock_mtu: PropertyMock, mock_max_unencoded_size: PropertyMock, mtu: int
+@pytest.mark.parametrize(
+    "file_data, file_path",
+    [("test.txt", "test.txt"), ("255_bytes.txt", "255_bytes.txt")],
+    indirect=["file_data"],
+)
+async def test_file_upload(
+    mock_mtu: PropertyMock,
+    mock_max_unencoded_size: PropertyMock,
+    mtu: int,
+    file_data: bytes,
+    file_path: str,
 ) -> None:
     mock_mtu.return_value = mtu
     mock_max_unencoded_size.return_value = mtu
-    with open(
-        str(Path("tests", "fixtures", "file_system", "255_bytes.txt")),
-        "rb",
-    ) as f:
-        data = f.read()
 
     m = SMPMockTransport()
     s = SMPClient(m, "address")
@@ -544,22 +525,19 @@ async def test_file_upload_test_255_bytes_file(
 
     s.request = mock_request  # type: ignore
 
-    async for _ in s.upload_file(data, file_path="255_bytes.txt"):
+    async for _ in s.upload_file(file_data, file_path=file_path):
         pass
 
-    assert accumulated_data == data
+    assert accumulated_data == file_data
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 @pytest.mark.parametrize("max_smp_encoded_frame_size", [128, 256, 512, 1024, 2048, 4096, 8192])
 @pytest.mark.parametrize("line_buffers", [1, 2, 3, 4, 8])
-async def test_file_upload_test_encoded(max_smp_encoded_frame_size: int, line_buffers: int) -> None:
-    with open(
-        str(Path("tests", "fixtures", "file_system", "test.txt")),
-        "rb",
-    ) as f:
-        file_data = f.read()
-
+@pytest.mark.parametrize("file_data", ["test.txt"], indirect=True)
+async def test_file_upload_test_encoded(
+    max_smp_encoded_frame_size: int, line_buffers: int, file_data: bytes
+) -> None:
     line_length = max_smp_encoded_frame_size // line_buffers
     if line_length < 83:  # TODO: get better coverage
         pytest.skip("The line buffer size is too small")
@@ -617,7 +595,7 @@ async def test_file_upload_test_encoded(max_smp_encoded_frame_size: int, line_bu
     assert reconstructed_file == file_data
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_download_file() -> None:
     m = SMPMockTransport()
     s = SMPClient(m, "address")
@@ -628,7 +606,7 @@ async def test_download_file() -> None:
     type(m).mtu = PropertyMock(return_value=498)
     type(m).max_unencoded_size = PropertyMock(return_value=498)
 
-    data = bytes([i % 255 for i in range(4097)])
+    data = PAYLOAD_4097
     s.request.side_effect = [
         FileDownloadResponse(off=0, data=data[0:456], len=4097),
         FileDownloadResponse(off=456, data=data[456:912]),
@@ -799,7 +777,7 @@ async def test_download_file() -> None:
     assert file_data == data
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_download_file_error_first() -> None:
     m = SMPMockTransport()
     s = SMPClient(m, "address")
@@ -832,7 +810,7 @@ async def test_download_file_error_first() -> None:
     assert e.value.args[0].err.rc == FS_MGMT_ERR.FILE_WRITE_FAILED
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_download_file_no_len_first() -> None:
     m = SMPMockTransport()
     s = SMPClient(m, "address")
@@ -844,7 +822,7 @@ async def test_download_file_no_len_first() -> None:
         name="test.txt",
         sequence=0,
     )
-    data = bytes([i % 255 for i in range(4097)])
+    data = PAYLOAD_4097
 
     s.request.return_value = FileDownloadResponse(
         header=smphdr.Header(
@@ -865,7 +843,7 @@ async def test_download_file_no_len_first() -> None:
     assert e.value.args[0].startswith("No length received: ")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_download_file_error_not_first() -> None:
     m = SMPMockTransport()
     s = SMPClient(m, "address")
@@ -877,7 +855,7 @@ async def test_download_file_error_not_first() -> None:
         name="test.txt",
         sequence=0,
     )
-    data = bytes([i % 255 for i in range(4097)])
+    data = PAYLOAD_4097
 
     s.request.side_effect = [
         FileDownloadResponse(
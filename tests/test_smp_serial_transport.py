@@ -6,7 +6,7 @@ import logging
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
-from serial import Serial
+from serial import Serial, SerialException
 from smp import packet as smppacket
 
 from smpclient.requests.os_management import EchoWrite
@@ -24,34 +24,39 @@ def test_constructor() -> None:
 
 
 @patch("smpclient.transport.serial.Serial")
-@pytest.mark.asyncio
-async def test_connect(_: MagicMock) -> None:
+@pytest.mark.asyncio(scope="module")
+@pytest.mark.parametrize("address", ["COM2", "/dev/ttyACM0"])
+async def test_connect(_: MagicMock, address: str) -> None:
     t = SMPSerialTransport()
 
-    await t.connect("COM2", 1.0)
-    assert t._conn.port == "COM2"
+    await t.connect(address, 1.0)
+    assert t._conn.port == address
 
     t._conn.open.assert_called_once()  # type: ignore
 
-    t._conn.reset_mock()  # type: ignore
 
+@patch("smpclient.transport.serial.Serial")
+@pytest.mark.asyncio(scope="module")
+async def test_connect_timeout(_: MagicMock) -> None:
     t = SMPSerialTransport()
+    t._conn.open.side_effect = SerialException("busy")  # type: ignore
 
-    await t.connect("/dev/ttyACM0", 1.0)
-    assert t._conn.port == "/dev/ttyACM0"
+    with pytest.raises(TimeoutError):
+        await t.connect("COM2", 0.010)
 
-    t._conn.open.assert_called_once()  # type: ignore
+    t._conn.open.assert_called()  # type: ignore
 
 
 @patch("smpclient.transport.serial.Serial")
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_disconnect(_: MagicMock) -> None:
     t = SMPSerialTransport()
     await t.disconnect()
     t._conn.close.assert_called_once()  # type: ignore
 
 
-@pytest.mark.asyncio
+@patch("smpclient.transport.serial.SMPSerialTransport._POLLING_INTERVAL_S", 0)
+@pytest.mark.asyncio(scope="module")
 async def test_send() -> None:
     t = SMPSerialTransport()
     t._conn.write = MagicMock()  # type: ignore
@@ -72,7 +77,7 @@ async def test_send() -> None:
     assert p.call_count == 2  # called twice since out buffer was not drained on first call
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_receive() -> None:
     t = SMPSerialTransport()
     m = EchoWrite._Response.get_default()(sequence=0, r="Hello pytest!")  # type: ignore
@@ -91,7 +96,8 @@ async def test_receive() -> None:
     assert b == m.BYTES
 
 
-@pytest.mark.asyncio
+@patch("smpclient.transport.serial.SMPSerialTransport._POLLING_INTERVAL_S", 0)
+@pytest.mark.asyncio(scope="module")
 async def test_readuntil() -> None:
     t = SMPSerialTransport()
     m1 = EchoWrite._Response.get_default()(sequence=0, r="Hello pytest!")  # type: ignore
@@ -125,7 +131,8 @@ async def test_readuntil() -> None:
         assert p == await t._readuntil()
 
 
-@pytest.mark.asyncio
+@patch("smpclient.transport.serial.SMPSerialTransport._POLLING_INTERVAL_S", 0)
+@pytest.mark.asyncio(scope="module")
 async def test_readuntil_with_smp_server_logging(caplog: pytest.LogCaptureFixture) -> None:
     t = SMPSerialTransport()
     m1 = EchoWrite._Response.get_default()(sequence=0, r="Hello pytest!")  # type: ignore
@@ -164,7 +171,7 @@ async def test_readuntil_with_smp_server_logging(caplog: pytest.LogCaptureFixtur
         assert "/dev/ttyUSB0: Thought \n I'd just say hi!\n\x00\x01\x02\x03Bye!\n" in messages
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_send_and_receive() -> None:
     t = SMPSerialTransport()
     t.send = AsyncMock()  # type: ignore
@@ -1,7 +1,7 @@
 """Tests for `SMPUDPTransport`."""
 
 import asyncio
-from typing import Final, cast
+from typing import Any, Dict, Final, cast
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
@@ -12,17 +12,15 @@ from smpclient.transport._udp_client import Addr, UDPClient
 from smpclient.transport.udp import SMPUDPTransport
 
 
-def test_init() -> None:
-    t = SMPUDPTransport()
-    assert t.mtu == 1500
+@pytest.mark.parametrize("kwargs, mtu", [({}, 1500), ({"mtu": 512}, 512)])
+def test_init(kwargs: Dict[str, Any], mtu: int) -> None:
+    t = SMPUDPTransport(**kwargs)
+    assert t.mtu == mtu
     assert isinstance(t._client, UDPClient)
 
-    t = SMPUDPTransport(mtu=512)
-    assert t.mtu == 512
-
 
 @patch("smpclient.transport.udp.UDPClient", autospec=True)
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_connect(_: MagicMock) -> None:
     t = SMPUDPTransport()
     t._client = cast(MagicMock, t._client)  # type: ignore
@@ -32,7 +30,7 @@ async def test_connect(_: MagicMock) -> None:
 
 
 @patch("smpclient.transport.udp.UDPClient", autospec=True)
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_disconnect(_: MagicMock) -> None:
     t = SMPUDPTransport()
     t._client = cast(MagicMock, t._client)  # type: ignore
@@ -53,7 +51,7 @@ async def test_disconnect(_: MagicMock) -> None:
 
 
 @patch("smpclient.transport.udp.UDPClient", autospec=True)
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_send(_: MagicMock) -> None:
     t = SMPUDPTransport()
     t._client.send = cast(MagicMock, t._client.send)  # type: ignore
@@ -73,7 +71,7 @@ async def test_send(_: MagicMock) -> None:
 
 
 @patch("smpclient.transport.udp.UDPClient", autospec=True)
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_receive(_: MagicMock) -> None:
     t = SMPUDPTransport()
     t._client.receive = AsyncMock()  # type: ignore
@@ -100,7 +98,7 @@ async def test_receive(_: MagicMock) -> None:
         await t.receive()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(scope="module")
 async def test_send_and_receive() -> None:
     with patch("smpclient.transport.udp.SMPUDPTransport.send") as send_mock, patch(
         "smpclient.transport.udp.SMPUDPTransport.receive"